@@ -30,6 +30,15 @@ ALPACA_API_KEYS: Dict[str, Any] = {
     "secret_key": os.getenv("ALPACA_API_SECRET_KEY"),
 }
 
+# Raw Alpaca Websocket Bar keys : OhlcData fields. Time is converted separately.
+_TICK_KEY_MAP = {
+    "o": "open",
+    "h": "high",
+    "l": "low",
+    "c": "close",
+    "v": "volume",
+}
+
 
 class AlpacaAPI:
     """
@@ -211,14 +220,7 @@ class AlpacaAPI:
             )
             return
 
-        update_obj = fta.OhlcData(
-            time=data.get("t").seconds * 1_000_000_000,
-            open=data.get("o"),
-            high=data.get("h"),
-            low=data.get("l"),
-            close=data.get("c"),
-            volume=data.get("v"),
-        )
+        update_obj = fta.OhlcData(time=data.get("t").seconds * 1_000_000_000, **_rename_tick(data))
 
         log.info(update_obj)
 
@@ -226,6 +228,11 @@ class AlpacaAPI:
             series.update_data(update_obj, accumulate=True)
 
 
+def _rename_tick(tick: dict) -> dict:
+    "Map a raw Alpaca Websocket Bar onto OhlcData's fields. Extra keys, e.g. 'S', 'n', 'vw', are dropped"
+    return {field: tick.get(key) for key, field in _TICK_KEY_MAP.items()}
+
+
 def symbols_from_df(matches: DataFrame, **defaults) -> list[fta.Ticker]:
     "Generate a list of Symbols from a dataframe of the relevant data"
     generator = (fta.Ticker.from_dict(obj, **defaults) for obj in matches.to_dict(orient="records"))
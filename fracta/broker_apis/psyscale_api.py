@@ -1,12 +1,15 @@
 "API to bridge Fracta Data Requests with a Psyscale Backend + Live Data Brokers"
 
 import sys
+import time
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import Optional, Protocol
 from psyscale import PsyscaleAsync
 from psyscale.dev import sql, Op, AssetTbls, AGGREGATE_ARGS, TICK_ARGS
 
+import numpy as np
 import pandas as pd
 import fracta as fta
 
@@ -15,6 +18,10 @@ from .alpaca_api import AlpacaAPI
 log = logging.getLogger("fracta_log")
 
 STD_ARGS = AGGREGATE_ARGS | TICK_ARGS
+KEEP_ALIVE_INTERVAL = 60  # Seconds
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 300  # Seconds. Symbol Tables change slowly
+DISTINCTS_TTL = 300  # Seconds
 
 ALPACA_RENAME_MAP = {
     "t": "dt",
@@ -27,6 +34,17 @@ ALPACA_RENAME_MAP = {
     "n": "ticks",
 }
 
+# Symbol Search filter templates, keyed by the filter's kwarg name. Parsed once, formatted per search.
+SYMBOL_FILTERS = {
+    "sources": sql.SQL("source = any({_vals})"),
+    "exchanges": sql.SQL("exchange = any({_vals})"),
+    "asset_classes": sql.SQL("asset_class = any({_vals})"),
+}
+
+# Alpaca's Column Order, and a prebuilt Index of the same columns w/ Fracta's naming.
+ALPACA_COLUMNS_IN = tuple(ALPACA_RENAME_MAP.keys())
+ALPACA_COLUMNS_OUT = pd.Index(ALPACA_RENAME_MAP.values())
+
 
 class WebSocketInterface(Protocol):
     "Protocol to Define WebSocket Owners"
@@ -35,10 +53,77 @@ class WebSocketInterface(Protocol):
     def close_socket(self, series: fta.indicators.Timeseries): ...
 
 
+class Broker(WebSocketInterface, Protocol):
+    "Protocol to Define Live Data Brokers. Returned Series Data must already use Fracta's column names."
+
+    def get_series(self, ticker: fta.Ticker, timeframe: fta.TF, start=None) -> Optional[pd.DataFrame]: ...
+
+
+class AlpacaBroker:
+    "Broker Adapter for the AlpacaAPI that renames Alpaca's columns to Fracta's"
+
+    def __init__(self, api: AlpacaAPI):
+        self.api = api
+
+    def get_series(self, ticker: fta.Ticker, timeframe: fta.TF, start=None) -> Optional[pd.DataFrame]:
+        "Fetch Series data from Alpaca with columns renamed to Fracta's naming"
+        fetched_data = self.api.get_series(ticker, timeframe, start=start)
+        if fetched_data is not None:
+            # Assign the Columns directly rather than through DataFrame.rename()
+            if tuple(fetched_data.columns) == ALPACA_COLUMNS_IN:
+                fetched_data.columns = ALPACA_COLUMNS_OUT
+            else:
+                fetched_data.columns = [ALPACA_RENAME_MAP.get(col, col) for col in fetched_data.columns]
+        return fetched_data
+
+    def open_socket(self, ticker: fta.Ticker, series: fta.indicators.Timeseries):
+        "Forward the Socket Request to Alpaca"
+        self.api.open_socket(ticker, series)
+
+    def close_socket(self, series: fta.indicators.Timeseries):
+        "Forward the Socket close Request to Alpaca"
+        self.api.close_socket(series)
+
+
+class _SearchCache:
+    "LRU Cache, with a TTL, of Symbol Search results keyed by the search string and filters"
+
+    def __init__(self, max_size: int = SEARCH_CACHE_SIZE, ttl: float = SEARCH_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, list[fta.Ticker]]] = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[list[fta.Ticker]]:
+        "Return the cached search results or None if they are missing or expired"
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: tuple, tickers: list[fta.Ticker]):
+        "Store search results, evicting the least recently used entry when full"
+        self._entries[key] = (time.monotonic() + self.ttl, tickers)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        "Drop all cached search results"
+        self._entries.clear()
+
+
 class PsyscaleAPI:
     "API to bridge Fracta Data Requests with a Psyscale Backend + Live Data Brokers"
 
-    def __init__(self) -> None:
+    def __init__(self, **db_kwargs) -> None:
+        """
+        Key-word args are passed directly to PsyscaleAsync. Connection Pool sizing can be
+        configured through them, otherwise the Database is initialized from env Variables.
+        """
         policy = asyncio.get_event_loop_policy()
         if sys.platform == "win32" and not isinstance(policy, asyncio.WindowsSelectorEventLoopPolicy):
             raise AttributeError(
@@ -46,21 +131,51 @@ class PsyscaleAPI:
                 "Use 'asyncio.set_event_loop_policy(WindowsSelectorEventLoopPolicy())' to make the Evt Loop compatible."
             )
 
-        self.db = PsyscaleAsync()  # Init with env Variables
-        srcs = {v.lower() for v in self.db.distinct_sources()}
+        self.db = PsyscaleAsync(**db_kwargs)  # Init with env Variables when not given kwargs
+        self._distincts: Optional[dict[str, list[str]]] = None
+        self._distincts_expiry = 0.0
+        srcs = frozenset(v.lower() for v in self._get_distincts()["source"])
+
+        # Dict of lowercase Ticker.source : Live Data Broker. See _get_broker()
+        self._brokers: dict[str, Broker] = {}
 
         if "alpaca" in srcs:
             self.alpaca_api = AlpacaAPI()
+            self._brokers["alpaca"] = AlpacaBroker(self.alpaca_api)
 
         # Dict of Series.js_id : Data Source managing the Open Socket
         self._open_sockets: dict[str, WebSocketInterface] = {}
+        self._search_cache = _SearchCache()
+
+        # Started by setup_window() so the API can be constructed outside of a running Event Loop
+        self._keep_alive_task: Optional[asyncio.Task] = None
 
     async def shutdown(self):
         "Shutdown the Asyncio Workers"
+        if self._keep_alive_task is not None:
+            self._keep_alive_task.cancel()
         await self.db.close()
         if getattr(self, "alpaca_api", None) is not None:
             await self.alpaca_api.shutdown()
 
+    async def _keep_alive(self):
+        """
+        Periodically ping the Database for low traffic UIs. Each ping only refreshes the single
+        connection the pool hands out. Pool sizing & idle timeouts are given through **db_kwargs.
+        """
+        while True:
+            await asyncio.sleep(KEEP_ALIVE_INTERVAL)
+            try:
+                await asyncio.to_thread(self.db.execute, sql.SQL("SELECT 1"))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                log.warning("Psyscale Keep-Alive query failed: %s", e)
+
+    def _get_broker(self, ticker: fta.Ticker) -> Optional[Broker]:
+        "The Live Data Broker of the Ticker's Source, if known. Sources are matched case-insensitively"
+        if ticker.source is None:
+            return None
+        return self._brokers.get(ticker.source.lower())
+
     def setup_window(self, window: fta.Window):
         "Setup the window will appropriate search filters and event responders."
         window.events.data_request += self.get_series
@@ -68,20 +183,39 @@ class PsyscaleAPI:
         window.events.open_socket += self.open_socket
         window.events.close_socket += self.close_socket
 
-        window.set_search_filters("source", self.db.distinct_sources())
-        window.set_search_filters("exchange", self.db.distinct_exchanges())
-        window.set_search_filters("asset_class", self.db.distinct_asset_classes())
+        if self._keep_alive_task is None:
+            self._keep_alive_task = asyncio.get_running_loop().create_task(self._keep_alive())
+
+        for category, items in self._get_distincts().items():
+            window.set_search_filters(category, items)
+
+    def _get_distincts(self) -> dict[str, list[str]]:
+        "Distinct Sources, Exchanges, & Asset Classes of the stored Symbols. Cached for DISTINCTS_TTL"
+        if self._distincts is None or self._distincts_expiry < time.monotonic():
+            self._distincts = {
+                "source": self.db.distinct_sources(),
+                "exchange": self.db.distinct_exchanges(),
+                "asset_class": self.db.distinct_asset_classes(),
+            }
+            self._distincts_expiry = time.monotonic() + DISTINCTS_TTL
+        return self._distincts
 
     def search_symbols(self, symbol: str, **filters) -> list[fta.Ticker]:
         "Search the Database's stored Symbols, returning matches as Ticker Objs"
-        _filters = []
+        # Each keystroke is a search. Serve repeated searches (e.g. Backspacing) without the Database.
+        cache_key = (
+            sys.intern(symbol),
+            tuple(filters["sources"]),
+            tuple(filters["exchanges"]),
+            tuple(filters["asset_classes"]),
+        )
+        if (tickers := self._search_cache.get(cache_key)) is not None:
+            return tickers.copy()
+
         # Manually form the filters for the Symbol search. Allows for use of any operator
-        if len(flts := filters["sources"]) > 0:
-            _filters.append(sql.SQL("source = any({_vals})").format(_vals=flts))
-        if len(flts := filters["exchanges"]) > 0:
-            _filters.append(sql.SQL("exchange = any({_vals})").format(_vals=flts))
-        if len(flts := filters["asset_classes"]) > 0:
-            _filters.append(sql.SQL("asset_class = any({_vals})").format(_vals=flts))
+        _filters = [
+            template.format(_vals=flts) for key, template in SYMBOL_FILTERS.items() if len(flts := filters[key]) > 0
+        ]
 
         # Perform Similary match of symbol against both name + symbol columns
         rsp, _ = self.db.execute(
@@ -89,9 +223,11 @@ class PsyscaleAPI:
             dict_cursor=True,
         )
 
-        return [fta.Ticker.from_dict(v) for v in rsp]
+        tickers = [fta.Ticker.from_dict(v) for v in rsp]
+        self._search_cache.put(cache_key, tickers)
+        return tickers.copy()
 
-    def get_series(self, ticker: fta.Ticker, timeframe: fta.TF) -> Optional[pd.DataFrame]:
+    async def get_series(self, ticker: fta.Ticker, timeframe: fta.TF) -> Optional[pd.DataFrame]:
         "Get Timeseries Data Joining data from Stored Data & Live Data Sources"
 
         if (pkey := ticker.get("pkey")) is None:
@@ -99,39 +235,48 @@ class PsyscaleAPI:
             log.warning("Cannot Get Series data for ticker: %s. It lacks a Primary Key Attribute", ticker)
             return None
 
-        stored_data, fetched_data, fetch_start = None, None, None
+        mdata = None
         if ticker.get("store"):
-            mdata = self.db.inferred_metadata(pkey, timeframe.as_timedelta())
-            if mdata is not None:
-                fetch_start = mdata.end_date
-                stored_data = self.db.get_series(
-                    pkey,
-                    timeframe.as_timedelta(),
-                    rtn_args=STD_ARGS,
-                    mdata=mdata,
-                )
-
-        # ---- Fetch Source Data ----
-        if ticker.source is None:
-            return stored_data
+            mdata = await asyncio.to_thread(self.db.inferred_metadata, pkey, timeframe.as_timedelta())
+        fetch_start = mdata.end_date if mdata is not None else None
 
-        if ticker.source.lower() == "alpaca":
-            fetched_data = self.alpaca_api.get_series(ticker, timeframe, start=fetch_start)
-            if fetched_data is not None:
-                fetched_data.rename(columns=ALPACA_RENAME_MAP, inplace=True)
+        # Stored & Source Data are independent requests once the metadata is known. Overlap them.
+        stored_data, fetched_data = await asyncio.gather(
+            self._get_stored_series(pkey, timeframe, mdata),
+            self._fetch_series(ticker, timeframe, fetch_start),
+        )
 
         # ---- Merge and Return ----
-        dfs = (stored_data, fetched_data)
-        return pd.concat(dfs) if any(df is not None for df in dfs) else None
+        return _merge_series(stored_data, fetched_data)
+
+    async def _get_stored_series(self, pkey: int, timeframe: fta.TF, mdata) -> Optional[pd.DataFrame]:
+        "Fetch the Series Data Stored in the Database, if any."
+        if mdata is None:
+            return None
+
+        return await asyncio.to_thread(
+            self.db.get_series,
+            pkey,
+            timeframe.as_timedelta(),
+            rtn_args=STD_ARGS,
+            mdata=mdata,
+        )
+
+    async def _fetch_series(self, ticker: fta.Ticker, timeframe: fta.TF, start) -> Optional[pd.DataFrame]:
+        "Fetch the Series Data from the Ticker's Source, if it's a known Source."
+        if (broker := self._get_broker(ticker)) is None:
+            return None
+
+        # Broker History Requests may be blocking. Keep them off the Event Loop.
+        return await asyncio.to_thread(broker.get_series, ticker, timeframe, start=start)
 
     def open_socket(self, ticker: fta.Ticker, series: fta.indicators.Timeseries):
         "Forward the Socket Request to the appropriate Data Source"
-        if ticker.source is None:
+        if (broker := self._get_broker(ticker)) is None:
             return
 
-        if ticker.source.lower() == "alpaca":
-            self._open_sockets[series.js_id] = self.alpaca_api
-            self.alpaca_api.open_socket(ticker, series)
+        self._open_sockets[series.js_id] = broker
+        broker.open_socket(ticker, series)
 
     def close_socket(self, series: fta.indicators.Timeseries):
         "Forward the Socket close Request to the appropriate Data Source"
@@ -140,3 +285,34 @@ class PsyscaleAPI:
 
         socket_manager = self._open_sockets.pop(series.js_id)
         socket_manager.close_socket(series)
+
+
+def _merge_series(stored_data: Optional[pd.DataFrame], fetched_data: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    "Append Fetched Source Data onto the end of Stored Data. Stored Data is favored where the two overlap."
+    if fetched_data is None or len(fetched_data) == 0:
+        return stored_data
+    if stored_data is None or len(stored_data) == 0:
+        return fetched_data
+
+    # Fetches start at the last stored bar, so the first few fetched bars may already be stored.
+    stored_end = pd.to_datetime(stored_data["dt"].iloc[-1], utc=True)
+    fetched_dt = pd.to_datetime(fetched_data["dt"], utc=True)
+    if fetched_dt.iloc[0] <= stored_end:
+        fetched_data = fetched_data[(fetched_dt > stored_end).to_numpy()]
+        if len(fetched_data) == 0:
+            return stored_data
+
+    # Match the stored dtypes so concat doesn't upcast, and copy, the stored data's blocks. Only where the
+    # cast is lossless though, e.g. fractional crypto volume must upcast an int64 stored column instead.
+    dtypes = {
+        col: dtype
+        for col, dtype in stored_data.dtypes.items()
+        if col in fetched_data.columns
+        and isinstance(dtype, np.dtype)
+        and isinstance(fetched_data[col].dtype, np.dtype)
+        and fetched_data[col].dtype != dtype
+        and np.can_cast(fetched_data[col].dtype, dtype, "safe")
+    }
+    fetched_data = fetched_data.astype(dtypes, copy=False)
+
+    return pd.concat((stored_data, fetched_data), axis=0, sort=False, copy=False)
@@ -1,6 +1,7 @@
 """Classes and functions that handle implementation of chart indicators"""
 
 from __future__ import annotations
+import sys
 from dataclasses import field
 from importlib import import_module
 from logging import getLogger
@@ -23,6 +24,7 @@ from .indicator_meta import (
     IndicatorMeta,
     OptionsMeta,
     IndicatorPackage,
+    parse_indicator_pkgs,
 )
 
 from .. import py_window as win
@@ -44,6 +46,7 @@ DataframeData: TypeAlias = Callable[[], pd.DataFrame]
 def output_property[T: Callable](func: T) -> T:
     "Property Decorator used to expose Indicator Parameters to other Indicators"
     func.__expose_param__ = True
+    _record_exposed_func(func)
     return func
 
 
@@ -51,9 +54,23 @@ def default_output_property[T: Callable](func: T) -> T:
     "Property Decorator used to expose Indicator Parameters to other Indicators"
     func.__expose_param__ = True
     func.__default_param__ = True
+    _record_exposed_func(func)
     return func
 
 
+def _record_exposed_func(func: Callable):
+    """
+    Record an exposed function in the namespace of the class body that's decorating it. The
+    IndicatorMeta can then find them by identity rather than inspecting every namespace value.
+    """
+    try:
+        namespace = currentframe().f_back.f_back.f_locals  # type: ignore
+        if "__qualname__" in namespace:  # Only record functions from within a Class Body
+            namespace.setdefault("__exposed_funcs__", []).append(func)
+    except AttributeError:
+        pass  # Frame not available, IndicatorMeta falls back to scanning the namespace
+
+
 # pylint: disable=redefined-builtin
 def param[T](
     default: T,
@@ -376,6 +393,7 @@ class Indicator(metaclass=IndicatorMeta):
     # Dunder Cls Param referenced by all Sub-Classes of Indicator
     __loaded_indicators__: dict[str, "type[Indicator]"] = {}
     __registered_indicators__: dict[str, IndicatorPackage] = {}
+    __ind_pkgs_loaded__: bool = False
 
     def __init__(
         self,
@@ -585,9 +603,22 @@ class Indicator(metaclass=IndicatorMeta):
         """
         self._watcher.link_args(args, self)
 
+    @classmethod
+    def __load_ind_pkgs__(cls):
+        "Retrieve the metadata of all installed indicator packages if it hasn't been already."
+        if Indicator.__ind_pkgs_loaded__:
+            return
+
+        # Update in place, keeping installed packages ahead of the User Indicators Package
+        pkg_details = parse_indicator_pkgs() | Indicator.__registered_indicators__
+        Indicator.__registered_indicators__.clear()
+        Indicator.__registered_indicators__.update(pkg_details)
+        Indicator.__ind_pkgs_loaded__ = True
+
     @classmethod
     def __populate_ind_pkgs__(cls):
         "Transfer all indicator package metadata to the window."
+        cls.__load_ind_pkgs__()
         cls._fwd_queue.put((JS_CMD.POPULATE_IND_PKGS, cls.__registered_indicators__))
 
     @classmethod
@@ -703,11 +734,12 @@ IndParent_T: TypeAlias = "win.ChartingFrame | Indicator"
 
 def retrieve_indicator_cls(pkg_key: str, ind_key: str) -> type[Indicator] | None:
     "Return an Indicator Subclass from a given package and indicator key Lazy Loading as needed."
-    access_key = pkg_key + "_" + ind_key
+    access_key = sys.intern(pkg_key + "_" + ind_key)
 
     if access_key in Indicator.__loaded_indicators__:
         return Indicator.__loaded_indicators__[access_key]
 
+    Indicator.__load_ind_pkgs__()
     if pkg_key not in Indicator.__registered_indicators__:
         log.warning("Requested Indicator but package [%s] is not known.", pkg_key)
         return
@@ -1,12 +1,13 @@
 """Meta Classes for Both the Indicator and IndicatorOptions Class"""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import MISSING, Field, dataclass
 from enum import Enum
 from abc import ABCMeta
 from importlib.metadata import entry_points
 from logging import getLogger
-from inspect import Signature, signature, _empty
-from types import NoneType
+from inspect import CO_VARARGS, CO_VARKEYWORDS, Parameter, unwrap
+from types import CodeType, NoneType
 from typing import (
     Dict,
     Optional,
@@ -15,6 +16,7 @@ from typing import (
     Tuple,
     get_args,
     get_origin,
+    get_type_hints,
 )
 
 import pandas as pd
@@ -58,16 +60,19 @@ class IndicatorMeta(ABCMeta):
     "Metaclass that creates class parameters based on an Indicator's implementation"
 
     def __new__(mcs, name, bases, namespace, /, **kwargs):
+        # Recorded by the output_property decorators. Popped so it doesn't become a class attribute
+        exposed_funcs = namespace.pop("__exposed_funcs__", None)
+
         # Allow ABCMeta to create the class
         cls = super().__new__(mcs, name, bases, namespace, **kwargs)
 
         if name != "Indicator":
-            analyse_indicator_subclass(cls, name, namespace)
+            analyse_indicator_subclass(cls, name, namespace, exposed_funcs)
             return cls
 
-        # BaseClass Initlization, go ahead and retreive all installed indicator pkg metadata.
-        pkg_details = parse_indicator_pkgs()
-        pkg_details |= {  # Merge in the baseline UserIndicators Package Group
+        # BaseClass Initlization. Installed indicator pkg metadata is only retrieved once it's
+        # needed (See Indicator.__load_ind_pkgs__) so that importing fracta doesn't scan Entry-Points.
+        pkg_details = {  # The baseline UserIndicators Package Group
             "__user_indicators": IndicatorPackage(
                 "__user_indicators",
                 "User Indicators",
@@ -77,11 +82,17 @@ class IndicatorMeta(ABCMeta):
             )
         }
         setattr(cls, "__registered_indicators__", pkg_details)
+        setattr(cls, "__ind_pkgs_loaded__", False)
         setattr(cls, "__loaded_indicators__", {})
 
         return cls
 
 
+def _norm_key(name: str) -> str:
+    "Normalize a Package/Indicator name into a key. Keys are interned since they're looked up often."
+    return sys.intern(name.lower().replace(" ", "_"))
+
+
 def parse_indicator_pkgs() -> dict[str, IndicatorPackage]:
     """
     Load indicator package Entry-Points and parse the metadata. Return '__registered_indicators__'
@@ -97,23 +108,26 @@ def parse_indicator_pkgs() -> dict[str, IndicatorPackage]:
                 "Attempted to load Fracta indicator package, but the package doesn't have a distribution?"
             )
 
-        pkg_key = pkg.dist.name.lower().replace(" ", "_")
+        pkg_key = _norm_key(pkg.dist.name)
         pkg_info = pkg.load()
-        indicator_map = {}
-
-        for ind in pkg_info["indicators"]:
-            if ind.get("unlisted") is True:
-                continue
-
-            ind_key = ind["name"].lower().replace(" ", "_")
-            indicator_map[ind_key] = IndicatorDetails(
-                ind_key,
-                ind["name"],
-                ind.get("version"),
-                ind.get("unlisted"),
-                ind.get("description"),
-                ind["entry_point"],
-            )
+        # Packages may provide a pre-built {ind_key: IndicatorDetails} map instead of a list to parse
+        indicator_map = pkg_info.get("indicator_map")
+
+        if indicator_map is None:
+            indicator_map = {}
+            for ind in pkg_info["indicators"]:
+                if ind.get("unlisted") is True:
+                    continue
+
+                ind_key = _norm_key(ind["name"])
+                indicator_map[ind_key] = IndicatorDetails(
+                    ind_key,
+                    ind["name"],
+                    ind.get("version"),
+                    ind.get("unlisted"),
+                    ind.get("description"),
+                    ind["entry_point"],
+                )
 
         if pkg_key in pkg_details:
             log.error(
@@ -126,7 +140,7 @@ def parse_indicator_pkgs() -> dict[str, IndicatorPackage]:
             pkg_key,
             pkg_info["name"],
             pkg_info["version"],
-            getattr(pkg_info, "description", None),
+            pkg_info.get("description"),
             indicator_map,
         )
 
@@ -135,33 +149,65 @@ def parse_indicator_pkgs() -> dict[str, IndicatorPackage]:
 
 # --------------- Indicator Subclass parsing functions ---------------
 
+# Parsed metadata of each created Indicator subclass, keyed by "module.qualname:version". Re-creating
+# a subclass (e.g. Jupyter autoreload) reuses the parse so long as the parsed functions are unchanged.
+_META_CACHE: dict[str, tuple] = {}
 
-def analyse_indicator_subclass(cls: type, name: str, namespace: dict):
-    "Construct Various Dunder Attributes used by the Indicator Class"
-    # Place the Signatures of these functions into Class Attributes. These Attributes
-    # will be used by the Watcher and others for indicator on indicator integration.
-    set_sig = signature(getattr(cls, "set_data", lambda: None))
-    if len(set_sig.parameters) <= 1:
-        raise TypeError(f"{name}.set_data() must take at least 1 argument")
-    set_args = parse_input_args(set_sig)
-    setattr(cls, "__set_args__", set_args)
 
-    update_sig = signature(getattr(cls, "update_data", lambda: None))
-    if len(update_sig.parameters) <= 1:
-        raise TypeError(f"{name}.update_data() must take at least 1 argument")
-    update_args = parse_input_args(update_sig)
-    setattr(cls, "__update_args__", update_args)
+def analyse_indicator_subclass(cls: type, name: str, namespace: dict, exposed_funcs: Optional[list] = None):
+    "Construct Various Dunder Attributes used by the Indicator Class"
+    set_func = unwrap(getattr(cls, "set_data", lambda: None))
+    update_func = unwrap(getattr(cls, "update_data", lambda: None))
+    if exposed_funcs is not None:
+        # Match the decorated functions by identity. This finds every name each is bound to, aliases
+        # included, and drops those that were later redefined, without a getattr() per namespace value.
+        exposed_ids = {id(f) for f in exposed_funcs}
+        exposed = [(k, v) for k, v in namespace.items() if id(v) in exposed_ids]
+    else:
+        exposed = [(k, v) for k, v in namespace.items() if getattr(v, "__expose_param__", False)]
+
+    funcs = [set_func, update_func, *(v for _, v in exposed)]
+    # Stringified annotations resolve against the defining module, which a reload replaces. Matching
+    # their strings would hand back the old module's types, so those subclasses are always parsed.
+    cacheable = not any(isinstance(a, str) for f in funcs for a in getattr(f, "__annotations__", {}).values())
+    fingerprint = (
+        _func_fingerprint(set_func),
+        _func_fingerprint(update_func),
+        tuple((k, _func_fingerprint(v)) for k, v in exposed),
+    )
+    cache_key = f"{cls.__module__}.{cls.__qualname__}:{getattr(cls, '__version__', '')}"
+    cached = _META_CACHE.get(cache_key) if cacheable else None
 
-    for _param in set(set_args.keys()).intersection(update_args.keys()):
-        if set_args[_param][0] != update_args[_param][0]:
-            raise TypeError(f"{cls} reused input argument name '{_param}' but changed the argument type.")
-    setattr(cls, "__input_args__", dict(set_args, **update_args))
+    if cached is not None and _fingerprints_match(cached[0], fingerprint):
+        _, set_args, update_args, input_args, outputs, default_name = cached
+    else:
+        # Place the Signatures of these functions into Class Attributes. These Attributes
+        # will be used by the Watcher and others for indicator on indicator integration.
+        if _param_count(set_func.__code__) <= 1:
+            raise TypeError(f"{name}.set_data() must take at least 1 argument")
+        set_args = parse_input_args(set_func)
+
+        if _param_count(update_func.__code__) <= 1:
+            raise TypeError(f"{name}.update_data() must take at least 1 argument")
+        update_args = parse_input_args(update_func)
+
+        small, large = (set_args, update_args) if len(set_args) < len(update_args) else (update_args, set_args)
+        for _param, (_type, _) in small.items():
+            if (other := large.get(_param)) is not None and other[0] != _type:
+                raise TypeError(f"{cls} reused input argument name '{_param}' but changed the argument type.")
+        input_args = set_args | update_args
+
+        outputs, default_name = parse_output_type(name, exposed)
+        if cacheable:
+            _META_CACHE[cache_key] = (fingerprint, set_args, update_args, input_args, outputs, default_name)
 
     # Populate Dunders, Note: all Dunders are defined by the Indicator Base Class.
     # and all dunders set via setattr() are subclass specific and don't cross contaminate.
-    outputs, default_out = parse_output_type(name, namespace)
+    setattr(cls, "__set_args__", set_args)
+    setattr(cls, "__update_args__", update_args)
+    setattr(cls, "__input_args__", input_args)
     setattr(cls, "__exposed_outputs__", outputs)
-    setattr(cls, "__default_output__", default_out)
+    setattr(cls, "__default_output__", namespace[default_name] if default_name is not None else None)
 
     if getattr(cls, "__registered__", False):
         # Indictor flagges as part of a package, metadata already known
@@ -169,8 +215,8 @@ def analyse_indicator_subclass(cls: type, name: str, namespace: dict):
 
     # No Metadata exists => a user imported their Indicator from a local path.
     # Populate the Indicator information into the 'user_indicators' package
-    ind_key = name.lower().replace(" ", "_")
-    access_key = "__user_indicators_" + ind_key
+    ind_key = _norm_key(name)
+    access_key = sys.intern("__user_indicators_" + ind_key)
     details = IndicatorDetails(
         ind_key,
         name,
@@ -191,58 +237,118 @@ def analyse_indicator_subclass(cls: type, name: str, namespace: dict):
     return cls
 
 
-def parse_input_args(sig: Signature) -> dict[str, tuple[type, Any]]:
-    "Parse Set_Data & Update_Data Function Signatures into {param name: [type , default value]}"
-    args = {}
-    for pos, (name, _param) in enumerate(sig.parameters.items()):
+def _param_count(code: CodeType) -> int:
+    "Number of Parameters a function's code object declares, Variadics included."
+    return (
+        code.co_argcount
+        + code.co_kwonlyargcount
+        + bool(code.co_flags & CO_VARARGS)
+        + bool(code.co_flags & CO_VARKEYWORDS)
+    )
+
+
+def _func_fingerprint(func: Any) -> tuple:
+    "The parts of a function that its parsed Indicator metadata depends upon."
+    # The output decorators' flags are set on the outermost function, so read them before unwrapping.
+    flags = (getattr(func, "__expose_param__", False), getattr(func, "__default_param__", False))
+    func = unwrap(func) if callable(func) else func
+    return (
+        flags,
+        getattr(func, "__code__", None),
+        getattr(func, "__defaults__", None),
+        getattr(func, "__kwdefaults__", None),
+        getattr(func, "__annotations__", None),
+    )
 
-        if _param.kind == _param.VAR_POSITIONAL or _param.kind == _param.VAR_KEYWORD or pos == 0:
-            continue  # Skip the Self Parameter & Variadics
 
-        if _param.kind == _param.POSITIONAL_ONLY:
-            raise TypeError(
-                "Indicator Set/Update Methods Cannot Use Position Only Args."
-            )  # Look, i'm not gonna code the Watcher to dance around that shit.
+def _fingerprints_match(a: tuple, b: tuple) -> bool:
+    "Compare two function fingerprints. Defaults that can't be compared, e.g. ndarrays, never match."
+    try:
+        return a == b
+    except (ValueError, TypeError):
+        return False
 
-        param_default = _param.default
-        param_type = object if isinstance(_param.annotation, _empty) else _param.annotation
+
+def parse_input_args(func: Callable) -> dict[str, tuple[type, Any]]:
+    "Parse Set_Data & Update_Data Function Signatures into {param name: [type , default value]}"
+    # Read the code object directly. inspect.signature() is far slower and this runs for every subclass.
+    code = func.__code__
+    if code.co_posonlyargcount > 1:
+        raise TypeError(
+            "Indicator Set/Update Methods Cannot Use Position Only Args."
+        )  # Look, i'm not gonna code the Watcher to dance around that shit.
+
+    n_pos = code.co_argcount
+    # Positional names are followed by Keyword-Only names. Variadic names come after both.
+    names = code.co_varnames[: n_pos + code.co_kwonlyargcount]
+    defaults = func.__defaults__ or ()
+    kw_defaults = func.__kwdefaults__ or {}
+    first_default = n_pos - len(defaults)
+
+    annotations = func.__annotations__
+    if any(isinstance(v, str) for v in annotations.values()):
+        try:  # Only pay for get_type_hints() when there are stringified annotations to resolve
+            annotations = get_type_hints(func)
+        except NameError:
+            pass  # Annotation only importable while Type Checking. Leave it as a string
+
+    args = {}
+    for pos, name in enumerate(names):
+        if pos == 0 and n_pos > 0:
+            continue  # Skip the Self Parameter
+
+        if pos < n_pos:
+            param_default = defaults[pos - first_default] if pos >= first_default else Parameter.empty
+        else:
+            param_default = kw_defaults.get(name, Parameter.empty)
+        param_type = annotations.get(name, object)
 
         args[name] = (param_type, param_default)
 
     return args
 
 
-def parse_output_type(cls_name, namespace) -> Tuple[dict[str, type], Optional[Callable]]:
-    "Parse the return signatures of output properties"
+def parse_output_type(cls_name, exposed: list[tuple[str, Any]]) -> Tuple[dict[str, str], Optional[str]]:
+    "Parse the return signatures of exposed output properties. Returns the outputs and the default output's name"
     outputs = {}
-    __default_output__ = None
-    for output_name, output_func in namespace.items():
-        if not getattr(output_func, "__expose_param__", False):
-            continue
+    default_name = None
+    for output_name, output_func in exposed:
         if not callable(output_func):
             log.warning("%s.%s must be a callable function", cls_name, output_name)
             continue
-        output_func_sig = signature(output_func)
-        if len(output_func_sig.parameters) > 1:
+        if _param_count(unwrap(output_func).__code__) > 1:
             log.warning("%s.%s cannot take args.", cls_name, output_name)
             continue
 
-        rtn_type = output_func_sig.return_annotation
+        rtn_type = output_func.__annotations__.get("return", Parameter.empty)
 
-        outputs[output_name] = "any" if isinstance(rtn_type, _empty) else str(rtn_type)
+        outputs[output_name] = "any" if rtn_type is Parameter.empty else str(rtn_type)
 
         if getattr(output_func, "__default_param__", False) and rtn_type == pd.Series:
             # Default output must be a single series for consistency
             # May change this to default_output_series & default_output_dataframe
-            __default_output__ = output_func
+            default_name = output_name
 
-    return outputs, __default_output__
+    return outputs, default_name
 
 
 # endregion
 
 # region --------------- --------------- Options Metaclass --------------- ---------------
 
+# Dunders that Python (and param()) place into every Options class namespace
+STD_DUNDERS = frozenset(
+    {
+        "__doc__",
+        "__annotations__",
+        "__qualname__",
+        "__module__",
+        "__arg_params__",
+        "__static_attributes__",
+        "__firstlineno__",
+    }
+)
+
 
 class OptionsMeta(type):
     """
@@ -263,29 +369,19 @@ class OptionsMeta(type):
         args = [key for key in namespace.keys() if not is_dunder(key)]
 
         # -------- Check that there are no extra dunder variables -------- #
-        std_dunders = {
-            "__doc__",
-            "__annotations__",
-            "__qualname__",
-            "__module__",
-            "__arg_params__",
-            "__static_attributes__",
-            "__firstlineno__",
-        }
-        if len(set(namespace.keys()).difference(set(args)).difference(std_dunders)) > 0:
-            raise AttributeError(
-                "Indicator Options cannot use Dunder Variable Names, Found:"
-                f"{set(namespace.keys()).difference(set(args)).difference(std_dunders)}"
-            )
+        extras = [k for k in namespace if k not in STD_DUNDERS and is_dunder(k)]
+        if extras:
+            raise AttributeError(f"Indicator Options cannot use Dunder Variable Names, Found:{extras}")
 
         # -------- Check that every non-dunder has a default value -------- #
         __annotations__ = namespace.get("__annotations__")
         if __annotations__ is None:
             __annotations__ = {}
 
-        if not set(args).issuperset(set(__annotations__)):
+        args_set = set(args)
+        if not all(k in args_set for k in __annotations__):
             raise AttributeError(f"Cannot init '{name}' All Parameters must have a default value.")
-        if not set(args).issubset(set(__annotations__)):
+        if not all(k in __annotations__ for k in args_set):
             raise AttributeError(
                 f"""
                 Cannot init '{name}' Parameters must have a type annotation
@@ -310,61 +406,62 @@ class OptionsMeta(type):
         # check data linkages
 
         for i, arg_key in enumerate(args):
+            val = namespace[arg_key]
             # if the Arg is an Object (like Color) then dataclasses requires a Field.
             # Convert that Field back to the default arg we need before continuing.
-            if arg := getattr(namespace[arg_key], "default_factory", None):
-                namespace[arg_key] = arg()
-            elif arg := getattr(namespace[arg_key], "default", None):
-                namespace[arg_key] = arg
+            if isinstance(val, Field):
+                val = val.default_factory() if val.default_factory is not MISSING else val.default
+                namespace[arg_key] = val
 
-            arg_type, src_type = _process_type(namespace[arg_key], __annotations__[arg_key])
+            arg_type, src_type = _process_type(val, __annotations__[arg_key])
 
             __arg_types__[arg_key] = arg_type
             if arg_type == "source":
                 __src_types__[arg_key] = src_type
             if arg_type == "enum":
                 # Store a reference to the Enum Class for reconstruction
-                __src_types__[arg_key] = type(namespace[arg_key])
+                __src_types__[arg_key] = type(val)
 
             # Place var in the global space if there was no param() call.
             if (alt_arg_name := f"@arg{i}") not in arg_params:
-                arg_struct = _parse_arg(arg_key, namespace[arg_key], arg_type, src_type)
+                arg_struct = _parse_arg(arg_key, val, arg_type, src_type)
                 __menu_struct__[arg_key] = (arg_type, arg_struct)
                 continue
 
             # Param() call on this arg. Fetch the Param() Options
             arg_param = arg_params[alt_arg_name]
-            arg_struct = _parse_arg_param(arg_key, namespace[arg_key], arg_type, src_type, arg_param)
+            arg_struct = _parse_arg_param(arg_key, val, arg_type, src_type, arg_param)
 
             # region  -- Place the argument at appropriate inline and group position --
             group = arg_param["group"]
             inline = arg_param["inline"]
             if group is not None:
                 # Ensure Group has been made in the menu_struct
-                if group not in __menu_struct__:
-                    __menu_struct__[group] = ("group", {})
+                group_entry = __menu_struct__.get(group)
+                if group_entry is None:
+                    group_entry = __menu_struct__[group] = ("group", {})
+                group_items = group_entry[1]
 
                 if inline is None:
                     # Place arg into the Group
-                    __menu_struct__[group][1][arg_key] = (arg_type, arg_struct)
+                    group_items[arg_key] = (arg_type, arg_struct)
                 else:
                     # Ensure inline has been made in the group
-                    if inline not in __menu_struct__[group][1]:
-                        __menu_struct__[group][1][inline] = ("inline", {})
+                    inline_entry = group_items.get(inline)
+                    if inline_entry is None:
+                        inline_entry = group_items[inline] = ("inline", {})
 
                     # Place arg into the Group and inline
-                    __menu_struct__[group][1][inline][1][arg_key] = (
-                        arg_type,
-                        arg_struct,
-                    )
+                    inline_entry[1][arg_key] = (arg_type, arg_struct)
 
             elif inline is not None:
                 # Ensure inline has been made in the menu_struct
-                if inline not in __menu_struct__:
-                    __menu_struct__[inline] = ("inline", {})
+                inline_entry = __menu_struct__.get(inline)
+                if inline_entry is None:
+                    inline_entry = __menu_struct__[inline] = ("inline", {})
 
                 # Place arg into the inline
-                __menu_struct__[inline][1][arg_key] = (arg_type, arg_struct)
+                inline_entry[1][arg_key] = (arg_type, arg_struct)
 
             else:
                 # Place arg directly into the menu_struct
@@ -381,6 +478,51 @@ class OptionsMeta(type):
 # --------------- Indicator Options parsing functions ---------------
 
 
+# Member names of each Enum class used by an Options class. Enums tend to be reused across Options.
+_ENUM_NAMES_CACHE: dict[type[Enum], tuple[str, ...]] = {}
+
+
+def _enum_names(e_cls: type[Enum]) -> tuple[str, ...]:
+    "Return the member names of an Enum class"
+    names = _ENUM_NAMES_CACHE.get(e_cls)
+    if names is None:
+        names = _ENUM_NAMES_CACHE[e_cls] = tuple(e.name for e in e_cls)
+    return names
+
+
+def _build_source_param(rtn_struct: dict, _: Any, src_arg: str, __: Any):
+    rtn_struct["src_type"] = src_arg
+
+
+def _build_number_param(rtn_struct: dict, _: Any, __: str, arg_params: Any):
+    rtn_struct["min"] = arg_params["min"]
+    rtn_struct["max"] = arg_params["max"]
+    rtn_struct["step"] = arg_params["step"]
+    rtn_struct["slider"] = arg_params["slider"]
+
+
+def _build_enum_param(rtn_struct: dict, arg: Any, _: str, arg_params: Any):
+    # Remap all of the Enums to be their name
+    rtn_struct["default"] = arg.name
+    if arg_params["options"] is not None:
+        # Ensure the default is in the options list
+        if arg not in arg_params["options"]:
+            arg_params["options"] = [arg, *arg_params["options"]]
+
+        rtn_struct["options"] = [e.name for e in arg_params["options"]]
+    else:
+        rtn_struct["options"] = _enum_names(type(arg))
+
+
+# Type specific additions to a param() argument's __menu_struct__ entry. Keyed by _process_type()'s
+# type_str. Types that need nothing beyond the common entries ("bool", "timestamp", ...) aren't listed.
+_ARG_BUILDERS: dict[str, Callable[[dict, Any, str, Any], None]] = {
+    "source": _build_source_param,
+    "number": _build_number_param,
+    "enum": _build_enum_param,
+}
+
+
 def _parse_arg_param(
     arg_key: str,
     arg: Any,
@@ -394,33 +536,11 @@ def _parse_arg_param(
         "tooltip": arg_params["tooltip"],
         "options": arg_params["options"],
         "autosend": arg_params["autosend"],
+        "title": arg_key if arg_params["title"] is None else arg_params["title"],
     }
 
-    rtn_struct["title"] = arg_key if arg_params["title"] is None else arg_params["title"]
-
-    if arg_type == "source":  # ------------------------------------------------
-        rtn_struct["src_type"] = src_arg
-
-    elif arg_type == "number":  # ----------------------------------------------
-        rtn_struct["min"] = arg_params["min"]
-        rtn_struct["max"] = arg_params["max"]
-        rtn_struct["step"] = arg_params["step"]
-        rtn_struct["slider"] = arg_params["slider"]
-
-    elif arg_type == "enum":  # ------------------------------------------------
-        # Remap all of the Enums to be their name
-        rtn_struct["default"] = arg.name
-        if arg_params["options"] is not None:
-            # Ensure the default is in the options list
-            if arg not in arg_params["options"]:
-                arg_params["options"] = [arg, *arg_params["options"]]
-
-            rtn_struct["options"] = [e.name for e in arg_params["options"]]
-        else:
-            rtn_struct["options"] = [e.name for e in type(arg)]  # type: ignore
-
-    # elif arg_type == "bool":
-    # elif arg_type == "timestamp":
+    if (builder := _ARG_BUILDERS.get(arg_type)) is not None:
+        builder(rtn_struct, arg, src_arg, arg_params)
 
     return rtn_struct
 
@@ -436,13 +556,24 @@ def _parse_arg(arg_key: str, arg: Any, arg_type: str, src_arg: str) -> dict:
     # If given an Enum, Auto Populate an Options list
     elif isinstance(arg, Enum):
         rtn_struct["default"] = arg.name
-        rtn_struct["options"] = [e.name for e in type(arg)]
+        rtn_struct["options"] = _enum_names(type(arg))
 
     return rtn_struct
 
 
+# Standardized type names of the Option types that map directly from a concrete class
+_TYPE_STR = {
+    int: "number",
+    float: "number",
+    str: "string",
+    bool: "bool",
+    pd.Timestamp: "timestamp",
+    Color: "color",
+}
+
+
 def _process_type(arg: Any, arg_type: type) -> Tuple[str, str]:
-    if arg_type == Ellipsis or arg_type == Any:
+    if arg_type is Ellipsis or arg_type is Any:
         arg_type = type(arg)
 
     origin = get_origin(arg_type)
@@ -451,45 +582,32 @@ def _process_type(arg: Any, arg_type: type) -> Tuple[str, str]:
     if origin is dict:
         raise TypeError("Indicator Option Type Cannot be a Dict")
 
-    type_bases = set(get_args(arg_type))
+    type_bases = get_args(arg_type)
 
     # Strip Optional / Union[None] Types from type _annotation_
     if is_optional := NoneType in type_bases:
-        type_bases = type_bases.difference({NoneType})
+        type_bases = tuple(t for t in type_bases if t is not NoneType)
 
-    if len(type_bases) == 1:
-        arg_type = (*type_bases,)[0]
-    elif len(type_bases) > 1:
+    n_bases = len(type_bases)
+    if n_bases == 1:
+        arg_type = type_bases[0]
+    elif n_bases > 1:
         raise TypeError("Indicator Option Type Cannot be a Union of Types")
 
-    type_str = ""
     src_type = ""
+    type_str = _TYPE_STR.get(arg_type)
 
-    # Bit nasty of an if statement, but it standardizes the names.
     # Differentiating between classes and callables is annoying
-    if arg_type == int or arg_type == float:
-        type_str = "number"
-    elif arg_type == str:
-        type_str = "string"
-    elif arg_type == bool:
-        type_str = "bool"
-    elif arg_type == pd.Timestamp:
-        type_str = "timestamp"
-    elif len(type_bases) == 0:
-        if issubclass(arg_type, Enum):
-            type_str = "enum"
-        elif arg_type == Color:
-            type_str = "color"
-        else:
+    if type_str is None and n_bases == 0:
+        if not issubclass(arg_type, Enum):
             raise TypeError("Indicator Option Type Cannot be an Object or NoneType")
-    elif len(type_bases) == 1:
+        type_str = "enum"
+    elif type_str is None:
         inputs, outputs = get_args(arg_type)
         if len(inputs) > 0:
             raise TypeError("Indicator Callables/Sources cannot require an input argument")
         type_str = "source"
         src_type = str(outputs)
-    else:
-        raise TypeError(f"Unknown Indicator Option Type: {arg_type = }")
 
     if (is_optional or arg is None) and type_str != "source":
         raise TypeError("Indicator Option Default Value/Type cannot be None/Optional unless it's a callable")
@@ -169,6 +169,6 @@ class Emitter[T: Callable](list[T]):
             return
 
         self.rsp_handler(
-            *rsp if isinstance(rsp, tuple) else rsp,  # only unpack tuples, not lists
+            *rsp if isinstance(rsp, tuple) else (rsp,),  # only unpack tuples, not lists
             **rsp_kwargs if rsp_kwargs is not None else {},
         )
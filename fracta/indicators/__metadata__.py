@@ -1,32 +1,34 @@
 """Metadata to Describe the Indicators Included in the Base Fracta Library."""
 
+from fracta.charting.indicator_meta import IndicatorDetails
+
 # These are the objects that are loaded to populate the Indicator's Menu.
 # They exist separately from the indicator's themselves so that only the information is
 # loaded, and the class is only loaded into memory once it's used.
 
-# Each of these entries should be a dictionary formatted so that is can be loaded into the
-# indicatormeta.py:IndicatorDetails Dataclass
-INDICATORS = [
-    {
-        "name": "SMA",
-        "version": "v0.0.0",
-        "description": "Simple Moving Average",
-        "entry_point": "fracta.indicators.sma:SMA",
-    },
-    {
-        "name": "Timeseries",
-        "unlisted": True,
-        "version": "v0.0.0",
-        "description": "Series Indicator that recieves, filters, and disseminates Raw Data",
-        "entry_point": "fracta.indicators.timeseries.timeseries:Timeseries",
-    },
-]
+# Each of these entries is a pre-built indicatormeta.py:IndicatorDetails Dataclass keyed by its
+# ind_key. (The indicator's name, lowercase w/ underscores). Unlisted Indicators, such as the
+# Timeseries, are loaded directly and so are not included.
+
+# Packages may instead provide an "indicators" list of dictionaries formatted so they can be
+# loaded into the IndicatorDetails Dataclass. That list is then parsed at every launch.
+INDICATOR_MAP = {
+    "sma": IndicatorDetails(
+        ind_key="sma",
+        ind_name="SMA",
+        ind_version="v0.0.0",
+        unlisted=None,
+        description="Simple Moving Average",
+        entry_point="fracta.indicators.sma:SMA",
+    ),
+}
 
 # This is a single Dictionary formatted to match the indicatormeta.py:IndicatorPackage Dataclass
-# This loaded via EntryPoint in indicatormeta.py right after the Indicator Class is made.
+# This is loaded via EntryPoint by indicator_meta.py:parse_indicator_pkgs() the first time the indicator
+# packages are needed. (See Indicator.__load_ind_pkgs__)
 PKG_INFO = {
     "name": "Built-In Indicators",
     "version": "v0.0.0",
     "description": "Pre-Installed Indicators for Fracta.",
-    "indicators": INDICATORS,
+    "indicator_map": INDICATOR_MAP,
 }
@@ -30,13 +30,29 @@ def setup_window_events(window: "Window"):
 class Data_request_sync(Protocol):
     def __call__(self, ticker: Ticker, timeframe: TF) -> "DataFrame" | list[dict[str, Any]] | None: ...
 class Data_request_async(Protocol):
-    def __call__(self, ticker: Ticker, timeframe: TF) -> "DataFrame" | list[dict[str, Any]] | None: ...
-
-
-def _timeseries_request_responder(data: "DataFrame" | list[dict[str, Any]] | None, series: Timeseries, **_):
-    "Function that responds to the data returned by an Event.data_request event"
-    if data is not None:
-        series.set_data(data)
+    async def __call__(self, ticker: Ticker, timeframe: TF) -> "DataFrame" | list[dict[str, Any]] | None: ...
+
+
+def _timeseries_request_responder(
+    data: "DataFrame" | list[dict[str, Any]] | None,
+    series: Timeseries,
+    ticker: Optional[Ticker] = None,
+    timeframe: Optional[TF] = None,
+    **_,
+):
+    """
+    Function that responds to the data returned by an Event.data_request event. Async requests
+    can return out of order, so responses for a ticker or timeframe the series has since moved
+    on from are dropped. The Live Data Socket is opened only after the history has been set.
+    """
+    if ticker is not None and (series.ticker != ticker or series.timeframe != timeframe):
+        return
+    if data is None:
+        return
+
+    series.set_data(data)
+    if series.main_data is not None:
+        series.events.open_socket(ticker=series.ticker, series=series)
 
 
 class Symbol_search_sync_1(Protocol):
@@ -177,12 +177,13 @@ class Timeseries(Indicator):
                 self.parent_frame.__set_displayed_timeframe__(timeframe)
 
         if self.ticker is not None and self.timeframe is not None:
+            # The response handler opens the socket once the history has been set. The request's
+            # ticker & timeframe are passed along so the handler can discard stale async responses.
             self.events.data_request(
                 ticker=self.ticker,
                 timeframe=self.timeframe,
-                rsp_kwargs={"series": self},
+                rsp_kwargs={"series": self, "ticker": self.ticker, "timeframe": self.timeframe},
             )
-            self.events.open_socket(ticker=self.ticker, series=self)
 
     # region ------------------ Abstract Method Implementations ------------------
 
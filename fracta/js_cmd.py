@@ -3,7 +3,8 @@ Implementations of Command Functions that return formatted Javascript ready for
 All Functions wave been rolled-up into VIEW_CMD_ROLODEX that Maps {JS_CMD: Function}
 """
 
-from math import floor
+from math import floor, inf
+from inspect import Parameter, signature
 from enum import Enum, IntEnum, auto
 from typing import Callable, Any, Optional
 from json import JSONEncoder, dumps
@@ -500,3 +501,38 @@ VIEW_CMD_ROLODEX: dict[JS_CMD, Callable[..., str | None]] = {
     JS_CMD.MINIMIZE: lambda_none,
     JS_CMD.LOAD_CSS: lambda_none,
 }
+
+
+def _arity(func: Callable) -> tuple[int, float]:
+    "The (min, max) number of positional args a function accepts"
+    n_min, n_max = 0, 0.0
+    for param in signature(func).parameters.values():
+        if param.kind == Parameter.VAR_POSITIONAL:
+            n_max = inf
+        elif param.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+            n_max += 1
+            n_min += param.default is Parameter.empty
+    return n_min, n_max
+
+
+# VIEW_CMD_ROLODEX as a list indexed by each JS_CMD's int value. Skips the Enum hash on the View's hot path
+VIEW_CMD_TABLE: list[Optional[Callable[..., str | None]]] = [None] * (max(JS_CMD) + 1)
+# (min, max) positional args of each command so mismatched messages are caught before the call.
+# Commands missing from the rolodex get an unsatisfiable range.
+VIEW_CMD_ARITY: list[tuple[int, float]] = [(1, 0)] * (max(JS_CMD) + 1)
+for _cmd, _func in VIEW_CMD_ROLODEX.items():
+    VIEW_CMD_TABLE[_cmd] = _func
+    VIEW_CMD_ARITY[_cmd] = _arity(_func)
+del _cmd, _func
+
+# Commands that wholly replace a piece of window state. Only the last of each in a batch needs to run
+IDEMPOTENT_CMDS = frozenset(
+    {
+        JS_CMD.UPDATE_TF_OPTS,
+        JS_CMD.UPDATE_SERIES_FAVS,
+        JS_CMD.UPDATE_LAYOUT_FAVS,
+        JS_CMD.SET_SYMBOL_ITEMS,
+        JS_CMD.SET_USER_COLORS,
+        JS_CMD.POPULATE_IND_PKGS,
+    }
+)
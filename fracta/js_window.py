@@ -1,9 +1,14 @@
 """Classes and Functions that handle the interface between Python and Javascript"""
 
 import logging
+from os import stat
 from os.path import dirname, abspath
-from inspect import getmembers, ismethod
+from functools import lru_cache
+from inspect import isfunction
 import multiprocessing as mp
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from multiprocessing.connection import Connection
 from multiprocessing.synchronize import Event as mp_EventClass
 from dataclasses import dataclass, field
 from typing import Callable, Optional, Protocol
@@ -12,10 +17,9 @@ from abc import ABC, abstractmethod
 import webview
 from webview.errors import JavascriptException
 
-from .js_cmd import JS_CMD, VIEW_CMD_ROLODEX
+from .js_cmd import JS_CMD, VIEW_CMD_TABLE, VIEW_CMD_ARITY, IDEMPOTENT_CMDS
 from .py_cmd import PY_CMD
 from .types import Ticker, TF
-from .util import is_dunder
 
 file_dir = dirname(abspath(__file__))
 logger = logging.getLogger("fracta_log")
@@ -34,9 +38,9 @@ class js_api:
     """
 
     def __init__(self):
-        # Pass in a temporary Object that we will overwrite later.
-        # This is really just used to silence linter errors
-        self.rtn_queue = mp.Queue(maxsize=1)
+        # Assigned by PyWv before any javascript callback can fire. No placeholder Queue is needed,
+        # the annotation alone is enough to silence linter errors
+        self.rtn_queue: "PipeQueue" = None  # type: ignore
         self.view_window: View
 
     def __set_view_window__(self, view_window: "View"):
@@ -122,15 +126,83 @@ class js_api:
         self.rtn_queue.put((PY_CMD.UPDATE_SERIES_OPTS, c_id, f_id, i_id, s_id, opts))
 
 
+@lru_cache(maxsize=None)
+def _exported_callbacks(api_cls: type[js_api]) -> tuple[str, ...]:
+    "Names of the js_api methods exposed to javascript. These are static for each js_api class"
+    # Walk the raw class dicts rather than getmembers() so no descriptors (e.g. properties) are invoked.
+    # util.is_dunder() is inlined into the filter.
+    names = {
+        name: None
+        for klass in api_cls.__mro__
+        for name, val in vars(klass).items()
+        if (isfunction(val) or isinstance(val, classmethod)) and not (name[:2] == "__" or name[-2:] == "__")
+    }
+    return tuple(names)
+
+
+def _read_css(filepath: str) -> str:
+    "Read a .css file. The file is only re-read when it's been modified since the last read"
+    return _read_css_version(filepath, stat(filepath).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_css_version(filepath: str, _mtime_ns: int) -> str:
+    with open(filepath, encoding="UTF-8") as file_handle:
+        return file_handle.read()
+
+
 ##### --------------------------------- Helper Classes --------------------------------- #####
 
 
+class PipeQueue:
+    """
+    Queue interface over a one-way mp.Pipe, used for the rtn_queue. It has a single consumer process
+    and only carries small PY_CMDs, so the mp.Queue feeder thread isn't needed. Puts block while the
+    pipe's buffer is full and are serialized per process by a thread lock since pywebview invokes
+    js_api callbacks from multiple threads.
+
+    The fwd_queue stays an mp.Queue. It carries whole DataFrames and is put into from the main
+    process' event loop, which mustn't block on a full pipe.
+    """
+
+    def __init__(self):
+        self._reader, self._writer = mp.Pipe(duplex=False)
+        self._put_lock = Lock()
+
+    def __getstate__(self) -> tuple[Connection, Connection]:
+        return self._reader, self._writer
+
+    def __setstate__(self, state: tuple[Connection, Connection]):
+        self._reader, self._writer = state
+        self._put_lock = Lock()
+
+    def put(self, obj):
+        with self._put_lock:
+            self._writer.send(obj)
+
+    def get_nowait(self):
+        try:
+            if not self._reader.poll():
+                raise Empty
+            return self._reader.recv()
+        except (EOFError, OSError) as e:
+            raise Empty from e  # The putting process has exited
+
+    def close_put_end(self):
+        "Close this process' copy of the put end. Call from the process that only gets"
+        self._writer.close()
+
+    def close_get_end(self):
+        "Close this process' copy of the get end. Call from the process that only puts"
+        self._reader.close()
+
+
 @dataclass
 class MpHooks:
     "All Multiprocessor Hooks required for the javascript Sub-Process interface"
 
     fwd_queue: mp.Queue = field(default_factory=mp.Queue)
-    rtn_queue: mp.Queue = field(default_factory=mp.Queue)
+    rtn_queue: PipeQueue = field(default_factory=PipeQueue)
     js_loaded_event: mp_EventClass = field(default_factory=mp.Event)
     stop_event: mp_EventClass = field(default_factory=mp.Event)
 
@@ -151,17 +223,29 @@ class View(ABC):
 
     Attributes:
         fwd_queue:          MP Queue That transfers data from __main_mp__ to __view_mp__
-        rtn_queue:          MP Queue That transfers data from __view_mp__ to __main_mp__
+        rtn_queue:          MP Pipe That transfers data from __view_mp__ to __main_mp__
         js_loaded_event:    MP Event that is set by __view_mp__ to indicate javascript window has
                                 been loaded and JS_CMDs can be executed
         stop_event:         MP Event that is set by either __main_mp__ or __view_mp__ to signal
                                 application shutdown
         run_script():       Callable function that takes a string representation of javascript that
                             will be evaluated in the window
-        rolodex:            A Dict Mapping JS_CMDs to Instance Functions for easy access
+        rolodex_tbl:        A List, indexed by JS_CMD, of the Instance Functions that execute PyWv Commands
 
     """
 
+    # PyWv Commands : Name of the View Function that executes it
+    _ROLODEX = {
+        JS_CMD.SHOW: "show",
+        JS_CMD.HIDE: "hide",
+        JS_CMD.CLOSE: "close",
+        JS_CMD.MAXIMIZE: "maximize",
+        JS_CMD.MINIMIZE: "minimize",
+        JS_CMD.RESTORE: "restore",
+        JS_CMD.LOAD_CSS: "load_css",
+    }
+    _ROLODEX_SLOTS: tuple[Optional[Callable], ...]
+
     def __init__(
         self,
         hooks: MpHooks,
@@ -173,15 +257,18 @@ class View(ABC):
         self.js_loaded_event = hooks.js_loaded_event
         self.stop_event = hooks.stop_event
 
-        self.rolodex = {
-            JS_CMD.SHOW: self.show,
-            JS_CMD.HIDE: self.hide,
-            JS_CMD.CLOSE: self.close,
-            JS_CMD.MAXIMIZE: self.maximize,
-            JS_CMD.MINIMIZE: self.minimize,
-            JS_CMD.RESTORE: self.restore,
-            JS_CMD.LOAD_CSS: self.load_css,
-        }
+        # Bind the subclass's resolved rolodex functions to this instance
+        self.rolodex_tbl: list[Optional[Callable]] = [
+            None if func is None else func.__get__(self) for func in self._ROLODEX_SLOTS
+        ]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the rolodex functions once per subclass, indexed by the JS_CMD's int value
+        slots: list[Optional[Callable]] = [None] * (max(JS_CMD) + 1)
+        for cmd, func_name in View._ROLODEX.items():
+            slots[cmd] = getattr(cls, func_name)
+        cls._ROLODEX_SLOTS = tuple(slots)
 
     @abstractmethod
     def show(self): ...
@@ -202,41 +289,63 @@ class View(ABC):
 
     def _manage_queue(self):
         "Infinite loop to manage Process Queue since it is launched in an isolated process"
-        batch_cmd, batch_size = "", 0
         while not self.stop_event.is_set():
             # get() doesn't need a timeout. the waiting will get interupted by the os
             # to go manage the thread that the webview is running in. Bit wasteful i think.
             # Would be nice to have pywebview run in an asyncio Thread
-            msg = self.fwd_queue.get()
-            cmd, *args = msg
-            logger.debug("Received CMD: %s, args: %s", cmd.name, args)
+            msgs = [self.fwd_queue.get()]
 
+            # Drain everything else already queued so a burst of cmds costs a single wake.
+            # The Batch Size Limit exists to limit how much the viewport appears to lockup
+            # while being flooded w/ cmds
             try:
-                # Lookup JS Command
-                cmd_str = VIEW_CMD_ROLODEX[cmd](*args)
-            except TypeError as e:
-                arg_list = [type(arg) for arg in args]
-                logger.error(
-                    "Command:%s: Given %s \n\tError msg: %s",
-                    JS_CMD(cmd).name,
-                    arg_list,
-                    e,
-                )
-                continue  # Skip to next Command
-
-            if cmd_str is None:
-                self.rolodex[cmd](*args)  # Given a PyWv Command, execute Immediately
-            else:
-                batch_size += 1
-                batch_cmd += cmd_str
+                while len(msgs) < 100:
+                    msgs.append(self.fwd_queue.get_nowait())
+            except Empty:
+                pass
+
+            batch_parts: list[str] = []
+            last_idx_by_cmd: dict[JS_CMD, int] = {}
+            log_debug = logger.isEnabledFor(logging.DEBUG)
+            for msg in msgs:
+                cmd, args = msg[0], msg[1:]
+                if log_debug:
+                    logger.debug("Received CMD: %s, args: %s", cmd.name, args)
+
+                n_min, n_max = VIEW_CMD_ARITY[cmd]
+                if not n_min <= len(args) <= n_max:
+                    logger.error("Command:%s: Given %s args, expected %s-%s", JS_CMD(cmd).name, len(args), n_min, n_max)
+                    continue  # Skip to next Command
+
+                try:
+                    # Lookup JS Command
+                    cmd_str = VIEW_CMD_TABLE[cmd](*args)  # type: ignore
+                except TypeError as e:
+                    # Args matched the signature but couldn't be formatted, e.g. an unserializable object
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error(
+                            "Command:%s: Given %s \n\tError msg: %s",
+                            JS_CMD(cmd).name,
+                            [type(arg) for arg in args],
+                            e,
+                        )
+                    continue  # Skip to next Command
+
+                if cmd_str is None:
+                    # Given a PyWv Command, execute Immediately
+                    self.rolodex_tbl[cmd](*args)  # type: ignore
+                else:
+                    if cmd in IDEMPOTENT_CMDS:
+                        # Coalesce repeated setters, only the last in the batch has any effect
+                        if (prev_idx := last_idx_by_cmd.get(cmd)) is not None:
+                            batch_parts[prev_idx] = ""
+                        last_idx_by_cmd[cmd] = len(batch_parts)
+                    batch_parts.append(cmd_str)
 
             # Batching is critical. Batching is atleast 3x faster than running individual cmds
-            # If not done then the queue can easily pileup too. The Batch Size Limit exists to
-            # limit how much the viewport appears to lockup while being flooded w/ cmds
-            if self.fwd_queue.empty() or batch_size >= 100:
-                self.run_script(batch_cmd)
-                batch_cmd = ""
-                batch_size = 0
+            # If not done then the queue can easily pileup too.
+            if batch_parts:
+                self.run_script("".join(batch_parts))
 
 
 class PyWv(View):
@@ -276,6 +385,8 @@ class PyWv(View):
         if api is None:
             api = js_api()
         api.rtn_queue = self.rtn_queue
+        # Only __main_mp__ gets from the rtn_queue
+        self.rtn_queue.close_get_end()
         self.api = api
 
         # hide by default since seeing window elements poping in is ugly.
@@ -306,31 +417,85 @@ class PyWv(View):
             **kwargs,
         )
 
+        # evaluate_js() blocks until the GUI thread runs the script. Hand scripts off to a dedicated
+        # thread so the Queue Manager can keep draining while Javascript executes. The Queue is kept
+        # short so the Queue Manager still blocks, and fwd_queue builds up a large batch, when Javascript
+        # falls behind rather than posting an unbounded run of tiny scripts.
+        self._script_q: Queue[Optional[tuple[str, Optional[Callable]]]] = Queue(maxsize=2)
+        self._script_thread = Thread(target=self._eval_js_loop, daemon=True)
+        self._script_thread.start()
+
         # Tell webview to execute api func assignment and enter main loop once loaded
-        # Order of these function calls matter
-        self.pyweb_window.events.loaded += lambda: api.__set_view_window__(self)
-        self.pyweb_window.events.loaded += self._assign_callbacks
-        self.pyweb_window.events.loaded += self._manage_queue
+        self.pyweb_window.events.loaded += self._on_loaded
         self.pyweb_window.events.maximized += self._on_maximized
         self.pyweb_window.events.restored += self._on_restore
 
         webview.start(debug=debug, private_mode=False)
         self.stop_event.set()
+        try:
+            self._script_q.put_nowait(None)
+        except Full:
+            pass  # Script thread is a daemon, it won't hold up the exit
+
+    def _on_loaded(self):
+        "Single loaded event handler. Order of these function calls matter"
+        self.api.__set_view_window__(self)
+        self._assign_callbacks()
+        self._manage_queue()
 
     def _handle_eval_js(self, cmd: str, promise: Optional[Callable] = None):
-        "evaluate_js() and catch errors"
+        "Queue a script to be evaluated. Only blocks while the script queue is full"
+        self._script_q.put((cmd, promise))
+
+    def _eval_js_loop(self):
+        "Evaluate queued scripts, joining everything pending into one evaluate_js(). Exits once given None"
+        while True:
+            items = [self._script_q.get()]
+            try:
+                while True:
+                    items.append(self._script_q.get_nowait())
+            except Empty:
+                pass
+
+            stop = False
+            parts: list[str] = []
+            for item in items:
+                if item is None:
+                    stop = True
+                    break
+                cmd, promise = item
+                if promise is None:
+                    parts.append(cmd)
+                    continue
+                # A promise wants its own script's result. Run it alone, after everything queued before it
+                if parts:
+                    self._eval_js("".join(parts))
+                    parts.clear()
+                self._eval_js(cmd, promise)
+
+            if parts:
+                self._eval_js("".join(parts))
+            if stop:
+                return
+
+    def _eval_js(self, cmd: str, promise: Optional[Callable] = None):
+        "evaluate_js() and catch errors. Blocks until the script has been run"
         try:
             # runscript for pywebview is the evaluate_js() function
             self.pyweb_window.evaluate_js(cmd, callback=promise)
         except JavascriptException as e:
             logger.error("JS Exception: %s\n\t\t\t\tscript: %s", e.args[0]["message"], cmd)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Don't let one bad script end the script thread and drop every script after it
+            logger.exception("Failed to evaluate script: %s\n\t\t\t\tscript: %s", e, cmd)
 
     def _assign_callbacks(self):
         "Read all the functions that exist in the api and expose non-dunder methods to javascript"
-        member_functions = getmembers(self.api, predicate=ismethod)
-        for name, _ in member_functions:
-            if not is_dunder(name):  # filter out dunder methods
-                self.assign_callback(name)
+        # Assign every callback in one script rather than one evaluate_js() round-trip per name.
+        # Evaluated directly, not queued, so the api is assigned before the loaded event is set.
+        self._eval_js(
+            "".join(f"window.api.{name} = pywebview.api.{name};" for name in _exported_callbacks(type(self.api)))
+        )
 
         # Signal to both python and javascript listeners that inital setup is complete
         self.js_loaded_event.set()
@@ -364,12 +529,9 @@ class PyWv(View):
 
     def load_css(self, filepath: str):
         try:
-            file_handle = open(filepath, encoding="UTF-8")
-            self.pyweb_window.load_css(file_handle.read())
+            self.pyweb_window.load_css(_read_css(filepath))
         except FileNotFoundError:
             logger.error("Cannot find/load .css file. Ensure filepath is absolute.")
-        finally:
-            file_handle.close()
 
     def _on_maximized(self):
         # For Some reason maximized doesn't auto update?
@@ -6,6 +6,7 @@ from enum import IntEnum, auto
 import logging
 import asyncio
 import multiprocessing as mp
+from queue import Empty
 from dataclasses import asdict
 from typing import TYPE_CHECKING, Callable, Literal, Optional, Protocol
 
@@ -109,6 +110,8 @@ class Window:
         kwargs["mp_hooks"] = mp_hooks  # Pass the hooks along to PyWv
         self._view_process = mp.Process(target=PyWv, kwargs=kwargs, daemon=daemon)
         self._view_process.start()
+        # Only __view_mp__ puts into the rtn_queue. Closing this end lets gets see EOF once it exits.
+        self._rtn_queue.close_put_end()
 
         if use_calendars:
             # Enable Calendars after Sub-process Launch so the module isn't loaded by that process.
@@ -152,14 +155,20 @@ class Window:
     async def _manage_queue(self):
         log.debug("Entered Async Queue Manager")
         while not self._stop_event.is_set():
-            if self._rtn_queue.empty():
-                # Sleep Time is to prioritize other Event Loop Calls.
-                # Can be set to 0 if the Rtn_Queue becomes more active.
-                await asyncio.sleep(0.05)
-            else:
-                cmd, *args = self._rtn_queue.get()
+            # Sleep Time is to prioritize other Event Loop Calls.
+            # Can be set to 0 if the Rtn_Queue becomes more active.
+            await asyncio.sleep(0.05)
+
+            # Drain every PY_CMD that arrived while asleep in a single wake
+            log_debug = log.isEnabledFor(logging.DEBUG)
+            while True:
+                try:
+                    cmd, *args = self._rtn_queue.get_nowait()
+                except Empty:
+                    break
                 WIN_CMD_ROLODEX[cmd](self, *args)
-                log.debug("PY_CMD: %s: %s", cmd.name, str(args))
+                if log_debug:
+                    log.debug("PY_CMD: %s: %s", cmd.name, str(args))
         log.debug("Exited Async Queue Manager")
 
     # region ------------------------ Public Window Methods  ------------------------ #